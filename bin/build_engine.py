@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+"""Builds a TensorRT engine for Cellpose inference.
+
+The resulting plan file can be used by setting default_config.USE_TRT
+and default_config.TRT_ENGINE_PATH in omero_screen.
+"""
+
+import argparse
+import sys
+
+
+def _main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Program to compile a Cellpose model into a TensorRT engine.",
+    )
+
+    parser.add_argument(
+        "model",
+        nargs="?",
+        default="cpsam",
+        help="Cellpose model to compile (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        dest="output",
+        default="cellpose.plan",
+        help="Path for the generated engine plan (default: %(default)s)",
+    )
+
+    args = parser.parse_args()
+
+    try:
+        from cellpose.contrib import trt_build
+    except ImportError:
+        print(
+            "TensorRT support is not installed "
+            "(requires cellpose with the tensorrt extra)",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+    trt_build.main([args.model, "-o", args.output])
+
+
+if __name__ == "__main__":
+    _main()
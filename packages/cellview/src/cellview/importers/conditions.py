@@ -3,6 +3,7 @@
 import logging
 
 import duckdb
+import numpy as np
 import pandas as pd
 from omero_screen.config import get_logger
 from rich.console import Console
@@ -195,6 +196,17 @@ class ConditionManager:
         condition_id_map = {row[0]: row[1] for row in result}
         self.logger.debug("Final condition_id_map: %s", condition_id_map)
         self.state.condition_id_map = condition_id_map
+        # Precompute the aligned well/condition-id arrays once here so
+        # the measurements importer can gather condition ids without
+        # rebuilding them from the dict on every import.
+        self.state.condition_lookup = (
+            list(condition_id_map.keys()),
+            np.fromiter(
+                condition_id_map.values(),
+                dtype=np.int64,
+                count=len(condition_id_map),
+            ),
+        )
         return condition_id_map
 
     def _identify_variable_columns(self) -> list[str]:
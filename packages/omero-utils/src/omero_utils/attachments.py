@@ -18,6 +18,7 @@ Available functions:
 
 """
 
+import io
 import os
 import tempfile
 from typing import Optional
@@ -35,6 +36,16 @@ from pandas import DataFrame
 
 logger = get_logger(__name__)
 
+# Prefer the Rust-backed calamine engine for reading Excel workbooks; it
+# parses xlsx several times faster than openpyxl. Fall back to openpyxl
+# when python-calamine is not installed.
+try:
+    import python_calamine  # noqa: F401
+
+    _EXCEL_ENGINE = "calamine"
+except ImportError:
+    _EXCEL_ENGINE = "openpyxl"
+
 
 def get_file_attachments(
     obj: BlitzObjectWrapper,
@@ -65,29 +76,35 @@ def get_file_attachments(
 
 def parse_excel_data(
     file_ann: FileAnnotationWrapper,
+    sheet_names: list[str] | None = None,
 ) -> dict[str, DataFrame] | None:
     """Parse Excel data from a file attachment.
 
     Args:
         file_ann: FileAnnotationWrapper containing an Excel file
+        sheet_names: Optional list of sheet names to read; restricting the
+            read avoids materializing sheets the caller does not need.
+            Defaults to all sheets.
 
     Returns:
         dict[str, DataFrame]: Dictionary mapping sheet names to pandas DataFrames
         or None if no Excel file is found
 
+    Raises:
+        ValueError: If a requested sheet name is not present in the workbook.
+
     """
     original_file: OriginalFileWrapper = file_ann.getFile()
-    try:
-        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
-            tmp_path = tmp.name
-            for chunk in original_file.asFileObj():
-                tmp.write(chunk)
-            tmp.flush()
-        logger.info("Parsing Excel Metadata File")
-        return pd.read_excel(tmp_path, sheet_name=None)  # type: ignore[no-any-return]
-    finally:
-        if tmp_path:
-            os.unlink(tmp_path)  # Delete the temporary file
+    # Stream the workbook into memory instead of round-tripping the bytes
+    # through a temporary file on disk
+    buffer = io.BytesIO()
+    for chunk in original_file.asFileObj():
+        buffer.write(chunk)
+    buffer.seek(0)
+    logger.info("Parsing Excel Metadata File")
+    return pd.read_excel(  # type: ignore[no-any-return]
+        buffer, sheet_name=sheet_names, engine=_EXCEL_ENGINE
+    )
 
 
 def parse_csv_data(
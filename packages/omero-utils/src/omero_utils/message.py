@@ -28,6 +28,11 @@ logger = get_logger(__name__)
 
 ERROR_STYLE = "bold red"
 
+# When True (the CLI default) errors print their rich panel as soon as
+# they are constructed. Library code that catches and swallows errors can
+# set this to False so tracebacks are only formatted via render().
+RENDER_ERRORS_EAGERLY = True
+
 # Global console instance
 _console: Console = Console()
 
@@ -42,7 +47,8 @@ def log_connection_success(
 ) -> None:
     """Log and print a success message."""
     logger_instance.info(message)
-    get_console().rule(f"[{style}] {message}: {datetime.now().ctime()}")
+    console = get_console()
+    console.rule(f"[{style}] {message}: {datetime.now().ctime()}")
 
 
 def log_success(
@@ -50,7 +56,8 @@ def log_success(
 ) -> None:
     """Log and print a success message."""
     logger_instance.info(message)
-    get_console().print(f"[{style}]✓ {message}")
+    console = get_console()
+    console.print(f"[{style}]✓ {message}")
 
 
 class OmeroError(Exception):
@@ -72,26 +79,37 @@ class OmeroError(Exception):
         super().__init__(message)
         self.logger = logger_instance
         self.original_error = original_error
-        self._log_and_display_error(message)
-
-    def _log_and_display_error(self, message: str) -> None:
-        """Log the error and display it with proper formatting."""
-        # Log the error message
         self.logger.error(message)
 
-        # Get the current exception info
-        exc_type, exc_value, exc_traceback = sys.exc_info()
+        # Capture raw references only; formatting the frames costs tens
+        # of microseconds per raise and is deferred until render().
+        self._exc_traceback = sys.exc_info()[2]
+        self._stack_frame = (
+            None if self._exc_traceback else sys._getframe(1)
+        )
+        if RENDER_ERRORS_EAGERLY:
+            self.render()
 
-        # If we're handling an exception, start from its traceback
-        if exc_traceback:
+    def render(self) -> None:
+        """Format the captured location and display the error panel."""
+        message = str(self)
+
+        # If we were raised while handling an exception, start from its
+        # traceback; otherwise reconstruct the call stack from the frame
+        # captured at construction time.
+        if self._exc_traceback:
             # Skip the last frame (this __init__ call)
             trace_str = "".join(
-                traceback.format_tb(exc_traceback.tb_next or exc_traceback)
+                traceback.format_tb(
+                    self._exc_traceback.tb_next or self._exc_traceback
+                )
             )
         else:
-            # If no current exception, get the call stack
-            stack = traceback.extract_stack()[:-1]  # Exclude current frame
-            trace_str = "".join(traceback.format_list(stack))
+            stack = traceback.StackSummary.extract(
+                traceback.walk_stack(self._stack_frame)
+            )
+            stack.reverse()
+            trace_str = "".join(stack.format())
 
         # Use the shared console which will have appropriate settings for terminal/file
         get_console().print(
@@ -45,6 +45,11 @@ class DefaultConfig:
         ]
     )
 
+    # Use a prebuilt TensorRT engine for Cellpose inference when one is
+    # available (see bin/build_engine.py).
+    USE_TRT: bool = False
+    TRT_ENGINE_PATH: str = ""
+
 
 # Create a singleton instance of DefaultConfig
 default_config = DefaultConfig()
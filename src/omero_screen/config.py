@@ -18,6 +18,7 @@ Raises:
 
 import logging
 import os
+import threading
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
@@ -26,6 +27,16 @@ from dotenv import load_dotenv
 # Define project_root at module level
 project_root = Path(__file__).parent.parent.parent.resolve()
 
+# Guards one-time configuration of the root logger
+_root_lock = threading.Lock()
+
+# External packages whose loggers are noisy at DEBUG/INFO level
+_EXTERNAL_LOGGERS = ("numba", "matplotlib", "omero", "fontTools", "cellpose")
+_external_loggers_silenced = False
+
+# Accepted truthy values for boolean environment variables
+_TRUTHY = frozenset({"true", "1", "yes"})
+
 
 def set_env_vars() -> None:
     """Loads environment variables from configuration files or the environment.
@@ -153,9 +164,25 @@ def get_logger(name: str) -> logging.Logger:
     # Get or create the logger
     logger = logging.getLogger(name)
 
-    # If the root logger isn't configured yet, configure it
+    _configure_root_logger()
+    _silence_external_loggers()
+
+    return logger
+
+
+def _configure_root_logger() -> None:
+    """Configure the root logger once, on the first `get_logger` call.
+
+    The unlocked handler check keeps repeated logger acquisitions free of
+    lock traffic; the lock only serializes the one-time configuration.
+    """
     root_logger = logging.getLogger()
-    if not root_logger.handlers:
+    if root_logger.handlers:
+        return
+
+    with _root_lock:
+        if root_logger.handlers:
+            return
         validate_env_vars()
 
         # Retrieve logging configurations from environment variables
@@ -212,14 +239,15 @@ def get_logger(name: str) -> logging.Logger:
             )  # Set file handler to desired level
             configure_log_handler(fh, LOG_LEVEL, formatter, root_logger)
 
-    # Suppress external logs
-    logging.getLogger("numba").setLevel(logging.WARNING)
-    logging.getLogger("matplotlib").setLevel(logging.WARNING)
-    logging.getLogger("omero").setLevel(logging.WARNING)
-    logging.getLogger("fontTools").setLevel(logging.WARNING)
-    logging.getLogger("cellpose").setLevel(logging.WARNING)
 
-    return logger
+def _silence_external_loggers() -> None:
+    """Raise external package loggers to WARNING, once per process."""
+    global _external_loggers_silenced
+    if _external_loggers_silenced:
+        return
+    for name in _EXTERNAL_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
+    _external_loggers_silenced = True
 
 
 def getenv_as_bool(name: str, default: bool = False) -> bool:
@@ -232,4 +260,4 @@ def getenv_as_bool(name: str, default: bool = False) -> bool:
         True if the variable has value {true, 1, yes} (case insensitive)
     """
     v = os.getenv(name)
-    return v.lower() in ["true", "1", "yes"] if v is not None else default
+    return v.lower() in _TRUTHY if v is not None else default
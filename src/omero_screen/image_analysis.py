@@ -20,27 +20,204 @@ Key Features:
 - Quality control metrics for each image channel.
 """
 
+import functools
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
 from typing import Any
 
 import numpy as np
 import numpy.typing as npt
 import pandas as pd
+import torch
 from cellpose import models
 from ezomero import get_image
 from omero.gateway import BlitzGateway, ImageWrapper, WellWrapper
 from omero_utils.images import parse_mip, upload_masks
-from pandas.api.types import is_integer_dtype
 from skimage import measure
 
 from omero_screen import default_config
-from omero_screen.general_functions import filter_segmentation, scale_img
+from omero_screen.general_functions import (
+    filter_segmentation,
+    mask_difference,
+)
 from omero_screen.image_classifier import ImageClassifier
 from omero_screen.metadata_parser import MetadataParser
 from omero_screen.torch import get_device
 
 logger = logging.getLogger("omero-screen")
 
+# Optional GPU-accelerated region properties. cucim computes each
+# property with a single CUDA kernel instead of skimage's per-region
+# Python loop; fall back to skimage when cucim/cupy are not installed.
+try:
+    import cupy as cp
+    from cucim.skimage.measure import (
+        regionprops_table as _regionprops_table_gpu,
+    )
+
+    _GPU_PROPS = cp.cuda.is_available()
+except ImportError:
+    _GPU_PROPS = False
+
+
+# Properties that reduce to per-label bincount passes
+_FAST_PROPS = frozenset(
+    {
+        "label",
+        "area",
+        "centroid",
+        "intensity_mean",
+        "intensity_min",
+        "intensity_max",
+    }
+)
+
+
+def _fast_props(
+    label: npt.NDArray[Any],
+    intensity_image: npt.NDArray[Any],
+    properties: list[str],
+) -> dict[str, npt.NDArray[Any]]:
+    """Measure reducible region properties with linear bincount passes.
+
+    For properties that are per-label reductions, regionprops builds a
+    Python object per region; the same numbers come out of a handful of
+    whole-image bincount/ufunc passes in O(N_pixels). Output matches
+    regionprops_table for the supported properties.
+
+    Args:
+        label (npt.NDArray[Any]): Labelled segmentation mask.
+        intensity_image (npt.NDArray[Any]): Intensity image matching the mask.
+        properties (list[str]): Properties to measure, all in _FAST_PROPS.
+
+    Returns:
+        dict[str, npt.NDArray[Any]]: Property name to value array.
+    """
+    flat_label = label.ravel()
+    counts = np.bincount(flat_label)
+    # Labels present in the mask, in sorted order as regionprops returns
+    labels = np.flatnonzero(counts)
+    labels = labels[labels != 0]
+    area = counts[labels].astype(np.float64)
+
+    props: dict[str, npt.NDArray[Any]] = {}
+    for prop in properties:
+        if prop == "label":
+            props["label"] = labels
+        elif prop == "area":
+            props["area"] = area
+        elif prop == "centroid":
+            rows, cols = np.indices(label.shape)
+            row_sums = np.bincount(flat_label, weights=rows.ravel())
+            col_sums = np.bincount(flat_label, weights=cols.ravel())
+            props["centroid-0"] = row_sums[labels] / area
+            props["centroid-1"] = col_sums[labels] / area
+        elif prop == "intensity_mean":
+            sums = np.bincount(
+                flat_label, weights=intensity_image.ravel()
+            )
+            props["intensity_mean"] = sums[labels] / area
+        elif prop == "intensity_min":
+            minima = np.full(counts.size, np.inf)
+            np.minimum.at(minima, flat_label, intensity_image.ravel())
+            props["intensity_min"] = minima[labels]
+        elif prop == "intensity_max":
+            maxima = np.full(counts.size, -np.inf)
+            np.maximum.at(maxima, flat_label, intensity_image.ravel())
+            props["intensity_max"] = maxima[labels]
+    return props
+
+
+@functools.lru_cache(maxsize=8)
+def _get_cellpose_model(model_type: str, device_str: str) -> Any:
+    """Return a shared CellposeModel for the given model and device.
+
+    Model construction loads the pretrained weights from disk and
+    copies them onto the device, so instances are cached and reused
+    across every Image of a plate run instead of being rebuilt per
+    image.
+
+    Args:
+        model_type (str): Name of the pretrained Cellpose model.
+        device_str (str): Torch device string, e.g. "cuda" or "cpu".
+
+    Returns:
+        The shared CellposeModel instance.
+    """
+    return models.CellposeModel(
+        device=torch.device(device_str),
+        model_type=model_type,
+    )
+
+
+@functools.lru_cache(maxsize=2)
+def _get_trt_model(engine_path: str) -> Any:
+    """Return a shared TensorRT Cellpose model for the given engine file.
+
+    Args:
+        engine_path (str): Path to the compiled TensorRT engine plan.
+
+    Returns:
+        The shared CellposeModelTRT instance.
+    """
+    from cellpose.contrib.cellposetrt import CellposeModelTRT
+
+    return CellposeModelTRT(pretrained_model=engine_path)
+
+
+@functools.cache
+def _metadata_columns(cond_keys: tuple[str, ...]) -> list[str]:
+    """Build the lowercase metadata column names for the given condition keys.
+
+    The key structure repeats for every image of a plate, so the list is
+    cached instead of being rebuilt and lowercased per image.
+
+    Args:
+        cond_keys (tuple[str, ...]): Keys of the well condition dict.
+
+    Returns:
+        list[str]: Lowercased metadata column names.
+    """
+    col_list = [
+        "experiment",
+        "plate_id",
+        "well",
+        "well_id",
+        "image_id",
+        *cond_keys,
+    ]
+    return [entry.lower() for entry in col_list]
+
+
+def _regionprops_table(
+    label: npt.NDArray[Any],
+    intensity_image: npt.NDArray[Any],
+    properties: list[str],
+) -> dict[str, npt.NDArray[Any]]:
+    """Compute a region properties table on the GPU when available.
+
+    Args:
+        label (npt.NDArray[Any]): Labelled segmentation mask.
+        intensity_image (npt.NDArray[Any]): Intensity image matching the mask.
+        properties (list[str]): Properties to measure.
+
+    Returns:
+        dict[str, npt.NDArray[Any]]: Property name to value array, on the host.
+    """
+    if label.ndim == 2 and _FAST_PROPS.issuperset(properties):
+        return _fast_props(label, intensity_image, properties)
+    if _GPU_PROPS:
+        props = _regionprops_table_gpu(
+            cp.asarray(label),
+            cp.asarray(intensity_image),
+            properties=properties,
+        )
+        return {key: cp.asnumpy(value) for key, value in props.items()}
+    return measure.regionprops_table(  # type: ignore[no-untyped-call, no-any-return]
+        label, intensity_image, properties=properties
+    )
+
 
 class Image:
     """Generates corrected images and segmentation masks for microscopy data.
@@ -49,7 +226,9 @@ class Image:
     It stores corrected images and segmentation results for downstream analysis.
 
     Attributes:
-        img_dict (dict[str, np.ndarray]): Dictionary mapping channel names to flatfield-corrected image arrays.
+        img_stack (np.ndarray): Flatfield-corrected image data as one contiguous (T, C, Y, X) array.
+        channel_index (dict[str, int]): Channel name to index into the C axis of img_stack.
+        img_dict (dict[str, np.ndarray]): Dictionary mapping channel names to (T, Y, X) views into img_stack.
         n_mask (np.ndarray): Segmentation mask for nuclei.
         c_mask (np.ndarray or None): Segmentation mask for cells, if available.
         cyto_mask (np.ndarray or None): Segmentation mask for cytoplasm, if available.
@@ -67,6 +246,15 @@ class Image:
         flatfield_dict (dict[str, np.ndarray]): Flatfield correction masks for each channel.
     """
 
+    # Number of images Cellpose processes per forward pass
+    CELLPOSE_BATCH_SIZE = 8
+
+    # Single shared worker so mask uploads overlap downstream compute
+    # while keeping OMERO calls from this path serialized
+    _upload_executor = ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="mask-upload"
+    )
+
     def __init__(
         self,
         conn: BlitzGateway,
@@ -92,8 +280,15 @@ class Image:
         self._meta_data = metadata
         self.dataset_id = dataset_id
         self._flatfield_dict = flatfield_dict
+        # Hoist the reciprocal out of the per-channel correction so the
+        # divide becomes a float32 multiply.
+        self._inv_flatfield_dict = {
+            ch: (1.0 / mask).astype(np.float32)
+            for ch, mask in flatfield_dict.items()
+        }
 
         self._get_metadata()
+        self._upload_future: Future[None] | None = None
         self.nuc_diameter = (
             10  # default value for nuclei diameter for 10x images
         )
@@ -111,8 +306,13 @@ class Image:
     def _get_img_dict(self) -> dict[str, npt.NDArray[Any]]:
         """Divide image_array with flatfield correction mask and return dictionary "channel_name": corrected image.
 
+        The corrected channels are written into one contiguous
+        img_stack of shape (T, C, Y, X); the returned dict maps channel
+        names to (T, Y, X) views into it, so per-channel consumers keep
+        their API while whole-stack consumers get contiguous data.
+
         Returns:
-            dict[str, npt.NDArray[Any]]: Dictionary mapping channel names to flatfield-corrected image arrays.
+            dict[str, npt.NDArray[Any]]: Dictionary mapping channel names to flatfield-corrected image views.
         """
         img_dict = {}
         image_id = self.omero_image.getId()
@@ -121,17 +321,28 @@ class Image:
         else:
             _, array = get_image(self._conn, image_id)
 
+        # array is TZYXC with Z already reduced to a single plane; drop
+        # it once up front (a free view) instead of per channel
+        planes = np.squeeze(array, axis=1)
+        t_dim, y_dim, x_dim, _ = planes.shape
+        self.channel_index = {
+            ch: i for i, ch in enumerate(self.channels)
+        }
+        self.img_stack = np.empty(
+            (t_dim, len(self.channels), y_dim, x_dim), dtype=np.float32
+        )
         for ch, idx in self.channels.items():
-            img = array[..., int(idx)] / self._flatfield_dict[ch]
-            # Reduce (tzyx) to (tyx)
-            img = np.squeeze(img, axis=1)
-
-            # # Convert back to original pixel type, clipping as necessary.
-            # np.clip(img, out=img, a_min=0, a_max=np.iinfo(array.dtype).max)
-            # img_dict[ch] = img.astype(array.dtype)
-
-            # Use float image. When passed to scale_img this will scale to [0, 1] for cellpose.
-            img_dict[ch] = img
+            # Multiply by the precomputed float32 reciprocal instead of
+            # dividing, writing straight into the stack slot: halves the
+            # bytes moved versus float64 and swaps the divide for a
+            # multiply.
+            np.multiply(
+                planes[..., int(idx)],
+                self._inv_flatfield_dict[ch],
+                out=self.img_stack[:, self.channel_index[ch]],
+            )
+            # Use float image. Cellpose normalizes it per channel during eval.
+            img_dict[ch] = self.img_stack[:, self.channel_index[ch]]
         return img_dict
 
     def _segmentation(
@@ -170,12 +381,16 @@ class Image:
             n_mask = self._n_segmentation()
             if "Tub" in self.channels:
                 c_mask = self._c_segmentation()
-                n_mask, c_mask = self._compact_mask(np.stack([n_mask, c_mask]))
+                n_mask, c_mask = self._compact_mask(n_mask, c_mask)
                 cyto_mask = self._get_cyto(n_mask, c_mask)
             else:
-                n_mask = self._compact_mask(n_mask)
+                (n_mask,) = self._compact_mask(n_mask)
 
-            upload_masks(
+            # Upload in the background; the network round-trip overlaps
+            # the feature extraction that follows. wait_for_upload() is
+            # the barrier before the masks are needed on the server.
+            self._upload_future = self._upload_executor.submit(
+                upload_masks,
                 self._conn,
                 self.dataset_id,
                 self.omero_image,
@@ -184,6 +399,15 @@ class Image:
             )
         return n_mask, c_mask, cyto_mask
 
+    def wait_for_upload(self) -> None:
+        """Block until the asynchronous mask upload has completed.
+
+        Re-raises any exception the upload hit in the worker thread.
+        """
+        if self._upload_future is not None:
+            self._upload_future.result()
+            self._upload_future = None
+
     def _get_cyto(
         self, n_mask: npt.NDArray[Any], c_mask: npt.NDArray[Any]
     ) -> npt.NDArray[Any] | None:
@@ -196,9 +420,40 @@ class Image:
         Returns:
             npt.NDArray[Any] | None: Cytoplasm segmentation mask.
         """
-        overlap = (c_mask != 0) * (n_mask != 0)
-        cyto_mask_binary = (c_mask != 0) * (overlap == 0)
-        return c_mask * cyto_mask_binary  # type: ignore[no-any-return]
+        # Fused parallel kernel: one read of each mask, no boolean
+        # temporaries.
+        return mask_difference(c_mask, n_mask)
+
+    def _create_segmentation_model(self, model_type: str) -> Any:
+        """Create the Cellpose model used for segmentation.
+
+        When default_config.USE_TRT is set and the configured engine
+        file exists, the TensorRT-compiled Cellpose model is used
+        instead of the PyTorch one; the engine can be built with
+        bin/build_engine.py. Falls back to the standard CellposeModel
+        when TensorRT support is unavailable.
+
+        Args:
+            model_type (str): Name of the pretrained Cellpose model.
+
+        Returns:
+            The Cellpose model instance to run eval on.
+        """
+        if default_config.USE_TRT and Path(
+            default_config.TRT_ENGINE_PATH
+        ).is_file():
+            try:
+                logger.info(
+                    "Using TensorRT engine %s",
+                    default_config.TRT_ENGINE_PATH,
+                )
+                return _get_trt_model(default_config.TRT_ENGINE_PATH)
+            except ImportError:
+                logger.warning(
+                    "TensorRT requested but cellpose.contrib.cellposetrt "
+                    "is unavailable; falling back to CellposeModel"
+                )
+        return _get_cellpose_model(model_type, str(get_device()))
 
     def _n_segmentation(self) -> npt.NDArray[Any]:
         """Performs nuclei segmentation using Cellpose models.
@@ -216,9 +471,8 @@ class Image:
         else:
             self.nuc_diameter = 10
 
-        segmentation_model = models.CellposeModel(
-            device=get_device(),
-            model_type=default_config.MODEL_DICT["nuclei"],
+        segmentation_model = self._create_segmentation_model(
+            default_config.MODEL_DICT["nuclei"]
         )
         # Get the image array
         img_array = self.img_dict["DAPI"]
@@ -226,27 +480,41 @@ class Image:
         # Initialize an array to store the segmentation masks
         segmentation_masks = np.zeros_like(img_array, dtype=np.uint32)
 
-        for t in range(img_array.shape[0]):
-            # Select the image at the current timepoint
-            img_t = img_array[t]
-
-            # Prepare the image for segmentation
-            scaled_img_t = scale_img(img_t)
-
-            # Perform segmentation
-            n_channels = [[0, 0]]
-            logger.info(
-                "Segmenting nuclei with diameter %s", self.nuc_diameter
+        # Let Cellpose normalize on the device instead of running a
+        # separate CPU percentile pass per frame: its default
+        # normalization is the same 1/99 percentile scaling scale_img
+        # applied here before.
+        imgs = list(img_array)
+
+        # Perform segmentation on the full stack in one batched call so
+        # Cellpose tiles across timepoints instead of paying per-frame
+        # model setup and kernel-launch overhead.
+        n_channels = [[0, 0]]
+        logger.info("Segmenting nuclei with diameter %s", self.nuc_diameter)
+        try:
+            n_mask_list, n_flows, n_styles = segmentation_model.eval(
+                imgs,
+                channels=n_channels,
+                diameter=self.nuc_diameter,
+                normalize=True,
+                batch_size=self.CELLPOSE_BATCH_SIZE,
             )
-            try:
-                n_mask_array, n_flows, n_styles = segmentation_model.eval(
-                    scaled_img_t,
-                    channels=n_channels,
-                    diameter=self.nuc_diameter,
-                    normalize=False,
-                )
-            except IndexError:
-                n_mask_array = np.zeros(scaled_img_t.shape, dtype=np.uint8)
+        except IndexError:
+            # Fall back to per-frame evaluation so one failing timepoint
+            # only zeroes its own mask.
+            n_mask_list = []
+            for img_t in imgs:
+                try:
+                    n_mask_array, n_flows, n_styles = segmentation_model.eval(
+                        img_t,
+                        channels=n_channels,
+                        diameter=self.nuc_diameter,
+                        normalize=True,
+                    )
+                except IndexError:
+                    n_mask_array = np.zeros(img_t.shape, dtype=np.uint8)
+                n_mask_list.append(n_mask_array)
+        for t, n_mask_array in enumerate(n_mask_list):
             # Store the segmentation mask in the corresponding timepoint
             segmentation_masks[t] = filter_segmentation(n_mask_array)
         return segmentation_masks
@@ -259,9 +527,8 @@ class Image:
         Returns:
             npt.NDArray[Any]: Segmentation mask for cells.
         """
-        segmentation_model = models.CellposeModel(
-            device=get_device(),
-            model_type=self._get_models(),
+        segmentation_model = self._create_segmentation_model(
+            self._get_models()
         )
         c_channels = [[2, 1]]
 
@@ -277,23 +544,42 @@ class Image:
         # Initialize an array to store the segmentation masks
         segmentation_masks = np.zeros_like(dapi_array, dtype=np.uint32)
 
-        # Process each timepoint
-        for t in range(dapi_array.shape[0]):
-            # Select the images at the current timepoint
-            dapi_t = dapi_array[t]
-            tub_t = tub_array[t]
-
-            # Combine the 2 channel numpy array for cell segmentation with the nuclei channel
-            comb_image_t = scale_img(np.dstack([dapi_t, tub_t]))
+        # Combine the 2 channel numpy arrays for cell segmentation with
+        # the nuclei channel, for every timepoint. Normalization happens
+        # inside Cellpose, per channel, instead of a separate CPU pass.
+        comb_images = [
+            np.dstack([dapi_array[t], tub_array[t]])
+            for t in range(dapi_array.shape[0])
+        ]
 
-            # Perform segmentation
-            try:
-                c_masks_array, c_flows, c_styles = segmentation_model.eval(
-                    comb_image_t, channels=c_channels, normalize=False
-                )
-            except IndexError:
-                c_masks_array = np.zeros_like(comb_image_t).astype(np.uint8)
+        # Perform segmentation on the full stack in one batched call
+        try:
+            c_mask_list, c_flows, c_styles = segmentation_model.eval(
+                comb_images,
+                channels=c_channels,
+                normalize=True,
+                batch_size=self.CELLPOSE_BATCH_SIZE,
+            )
+        except IndexError:
+            # Fall back to per-frame evaluation so one failing timepoint
+            # only zeroes its own mask.
+            c_mask_list = []
+            for comb_image_t in comb_images:
+                try:
+                    c_masks_array, c_flows, c_styles = (
+                        segmentation_model.eval(
+                            comb_image_t,
+                            channels=c_channels,
+                            normalize=True,
+                        )
+                    )
+                except IndexError:
+                    c_masks_array = np.zeros_like(comb_image_t).astype(
+                        np.uint8
+                    )
+                c_mask_list.append(c_masks_array)
 
+        for t, c_masks_array in enumerate(c_mask_list):
             # Store the segmentation mask in the corresponding timepoint
             segmentation_masks[t] = filter_segmentation(c_masks_array)
         return segmentation_masks
@@ -318,21 +604,29 @@ class Image:
         else:
             return default_config.MODEL_DICT["U2OS"]
 
-    def _compact_mask(self, mask: npt.NDArray[Any]) -> npt.NDArray[Any]:
+    def _compact_mask(
+        self, *masks: npt.NDArray[Any]
+    ) -> tuple[npt.NDArray[Any], ...]:
         """Compact the uint32 datatype to the smallest required to store all mask IDs.
 
+        All masks are downcast to the same dtype, chosen from their
+        joint maximum; taking the masks separately avoids stacking them
+        into a temporary twice their size just to find that maximum.
+
         Args:
-            mask (npt.NDArray[Any]): Segmentation mask.
+            *masks (npt.NDArray[Any]): Segmentation masks.
 
         Returns:
-            npt.NDArray[Any]: Compact segmentation mask.
+            tuple[npt.NDArray[Any], ...]: The compact segmentation
+            masks, in the order they were given.
         """
-        m = mask.max()
+        m = max(int(mask.max()) for mask in masks)
         if m < 2**8:
-            return mask.astype(np.uint8)
-        if m < 2**16:
-            return mask.astype(np.uint16)
-        return mask
+            return tuple(mask.astype(np.uint8) for mask in masks)
+        elif m < 2**16:
+            return tuple(mask.astype(np.uint16) for mask in masks)
+        else:
+            return masks
 
 
 class ImageProperties:
@@ -374,6 +668,11 @@ class ImageProperties:
         self._well_id = well.getId()
         self._image = image_obj
         self._meta_data = meta_data
+        # Shape-only region properties per (segment, timepoint), shared
+        # across the channel loop
+        self._shape_cache: dict[
+            tuple[str, int], dict[str, npt.NDArray[Any]]
+        ] = {}
 
         # Assumes the well parent is the plate
         self.plate_name = well.getParent().getName()
@@ -390,6 +689,9 @@ class ImageProperties:
                         self.image_df, image_obj.c_mask
                     )
 
+        # Barrier for the background mask upload started in Image
+        image_obj.wait_for_upload()
+
     def _overlay_mask(self) -> pd.DataFrame:
         """Links nuclear IDs with cell IDs.
 
@@ -401,17 +703,16 @@ class ImageProperties:
         if self._image.c_mask is None:
             return pd.DataFrame({"label": self._image.n_mask.flatten()})
 
-        overlap = (self._image.c_mask != 0) * (self._image.n_mask != 0)
-        stack = np.stack(
-            [self._image.n_mask[overlap], self._image.c_mask[overlap]]
-        )
-        list_n_masks = stack[-2].tolist()
-        list_masks = stack[-1].tolist()
-        overlay_all = {
-            list_n_masks[i]: list_masks[i] for i in range(len(list_n_masks))
-        }
+        overlap = (self._image.c_mask != 0) & (self._image.n_mask != 0)
+        n_ids = self._image.n_mask[overlap]
+        c_ids = self._image.c_mask[overlap]
+        # One row per nucleus ID, keeping the cell ID of its last
+        # overlapping pixel in scan order -- the same entry the previous
+        # per-pixel dict comprehension ended up with, without the Python
+        # loop over every overlapping pixel.
+        labels, first_idx = np.unique(n_ids[::-1], return_index=True)
         return pd.DataFrame(
-            list(overlay_all.items()), columns=["label", "Cyto_ID"]
+            {"label": labels, "Cyto_ID": c_ids[::-1][first_idx]}
         )
 
     def _combine_channels(self, featurelist: list[str]) -> pd.DataFrame:
@@ -422,10 +723,22 @@ class ImageProperties:
         Returns:
             pd.DataFrame: DataFrame containing feature measurements for all regions and channels.
         """
-        channel_data = [
-            self._channel_data(channel, featurelist)
-            for channel in self._meta_data.channel_data
-        ]
+        channels = list(self._meta_data.channel_data)
+        if len(channels) > 1:
+            # Channels are measured on independent arrays and the
+            # compiled regionprops kernels release the GIL, so a thread
+            # per channel parallelizes the property extraction.
+            with ThreadPoolExecutor(max_workers=len(channels)) as executor:
+                channel_data = list(
+                    executor.map(
+                        lambda channel: self._channel_data(
+                            channel, featurelist
+                        ),
+                        channels,
+                    )
+                )
+        else:
+            channel_data = [self._channel_data(channels[0], featurelist)]
         props_data = pd.concat(channel_data, axis=1, join="inner")
         edited_props_data = props_data.loc[
             :, ~props_data.columns.duplicated()
@@ -438,10 +751,11 @@ class ImageProperties:
             self._image.omero_image.getId(),
         ]
         cond_list.extend(iter(self._cond_dict.values()))
-        col_list = ["experiment", "plate_id", "well", "well_id", "image_id"]
-        col_list.extend(iter(self._cond_dict.keys()))
-        col_list_edited = [entry.lower() for entry in col_list]
-        edited_props_data[col_list_edited] = cond_list
+        col_list_edited = _metadata_columns(tuple(self._cond_dict.keys()))
+        # Per-column scalar assignment avoids pandas' aligned
+        # multi-column __setitem__ path.
+        for col, value in zip(col_list_edited, cond_list, strict=True):
+            edited_props_data[col] = value
 
         return edited_props_data.sort_values(by=["timepoint"]).reset_index(
             drop=True
@@ -462,7 +776,7 @@ class ImageProperties:
         )
         # merge channel data, outer merge combines all area columns into 1
         if self._image.c_mask is not None:
-            nucleus_data = self._outer_merge(
+            nucleus_data = self._inner_merge(
                 nucleus_data, self._overlay, "label"
             )
         if channel == "DAPI":
@@ -481,11 +795,11 @@ class ImageProperties:
             cyto_data = self._get_properties(
                 self._image.cyto_mask, channel, "cyto", featurelist
             )
-            merge_1 = self._outer_merge(
+            merge_1 = self._inner_merge(
                 cell_data, cyto_data, ["label", "timepoint"]
             )
             merge_1 = merge_1.rename(columns={"label": "Cyto_ID"})
-            return self._outer_merge(
+            return self._inner_merge(
                 nucleus_data, merge_1, ["Cyto_ID", "timepoint"]
             )
         else:
@@ -512,11 +826,13 @@ class ImageProperties:
         if timepoints > 1:
             data_list = []
             for t in range(timepoints):
-                props = measure.regionprops_table(  # type: ignore[no-untyped-call]
+                props = self._segment_props(
                     label[t],
                     # squeezing z
                     np.squeeze(self._image.img_dict[channel][t]),
-                    properties=featurelist,
+                    segment,
+                    t,
+                    featurelist,
                 )
                 data = pd.DataFrame(props)
                 feature_dict = self._edit_properties(
@@ -530,11 +846,13 @@ class ImageProperties:
                 by=["timepoint", "label"]
             ).reset_index(drop=True)
         else:
-            props = measure.regionprops_table(  # type: ignore[no-untyped-call]
+            props = self._segment_props(
                 label,
                 # squeezing tz
                 np.squeeze(self._image.img_dict[channel]),
-                properties=featurelist,
+                segment,
+                0,
+                featurelist,
             )
             data = pd.DataFrame(props)
             feature_dict = self._edit_properties(channel, segment, featurelist)
@@ -542,6 +860,49 @@ class ImageProperties:
             data["timepoint"] = 0  # Add timepoint 0 for single timepoint data
             return data.sort_values(by=["label"]).reset_index(drop=True)
 
+    def _segment_props(
+        self,
+        label: npt.NDArray[Any],
+        intensity_image: npt.NDArray[Any],
+        segment: str,
+        timepoint: int,
+        featurelist: list[str],
+    ) -> dict[str, npt.NDArray[Any]]:
+        """Measure region properties, reusing shape props across channels.
+
+        Shape-derived properties (label, area, centroid, ...) depend
+        only on the segmentation mask, which is identical for every
+        channel of the same segment, so they are measured once per
+        (segment, timepoint) and cached. Only the intensity properties
+        are recomputed per channel.
+
+        Returns:
+            dict[str, npt.NDArray[Any]]: Property name to value array.
+        """
+        intensity_features = [
+            feature
+            for feature in featurelist
+            if feature.startswith("intensity")
+        ]
+        shape_features = [
+            feature
+            for feature in featurelist
+            if not feature.startswith("intensity")
+        ]
+        key = (segment, timepoint)
+        if key not in self._shape_cache:
+            self._shape_cache[key] = _regionprops_table(
+                label, intensity_image, shape_features
+            )
+        props = dict(self._shape_cache[key])
+        if intensity_features:
+            props.update(
+                _regionprops_table(
+                    label, intensity_image, intensity_features
+                )
+            )
+        return props
+
     @staticmethod
     def _edit_properties(
         channel: str, segment: str, featurelist: list[str]
@@ -562,33 +923,26 @@ class ImageProperties:
         )
         return feature_dict
 
-    def _outer_merge(
+    def _inner_merge(
         self, df1: pd.DataFrame, df2: pd.DataFrame, on: list[str] | str
     ) -> pd.DataFrame:
-        """Perform an outer-join merge on the two pandas dataframes. NA rows are removed and integer columns are restored.
+        """Perform an inner-join merge on the two pandas dataframes. NA rows are removed.
 
-        This method performs an outer-join merge on the two pandas DataFrames and removes NA rows.
+        An inner join keeps exactly the rows an outer join followed by
+        dropna kept, but never allocates the NaN-padded rows for
+        non-matching keys, so integer columns keep their dtypes without
+        a restoration pass. The dropna only removes rows with genuine
+        NA values in the input frames.
 
         Returns:
-            pd.DataFrame: Merged DataFrame with integer columns restored.
+            pd.DataFrame: Merged DataFrame.
         """
-        df = pd.merge(df1, df2, how="outer", on=on).dropna(axis=0, how="any")
-        # Outer-join merge will create columns that support NA. This changes int columns to float.
-        # After dropping all the NA rows restore the int columns.
-        for c in df1.columns:
-            if is_integer_dtype(df1[c].dtype) and not is_integer_dtype(
-                df[c].dtype
-            ):
-                df[c] = df[c].astype(df1[c].dtype)
-        for c in df2.columns:
-            if is_integer_dtype(df2[c].dtype) and not is_integer_dtype(
-                df[c].dtype
-            ):
-                df[c] = df[c].astype(df2[c].dtype)
-        return df
+        return pd.merge(df1, df2, how="inner", on=on).dropna(
+            axis=0, how="any"
+        )
 
     def _set_quality_df(
-        self, channel: str, corr_img: npt.NDArray[Any]
+        self, channel: str, intensity_median: float
     ) -> pd.DataFrame:
         """Generates df for image quality control saving the median intensity of the image.
 
@@ -604,20 +958,25 @@ class ImageProperties:
                 "position": [self._image.well_pos],
                 "image_id": [self._image.omero_image.getId()],
                 "channel": [channel],
-                "intensity_median": [np.median(corr_img)],
+                "intensity_median": [intensity_median],
             }
         )
 
     def _concat_quality_df(self) -> pd.DataFrame:
-        """Concatenate quality dfs for all channels in _corr_img_dict.
+        """Concatenate quality dfs for all channels in the image stack.
 
-        This method concatenates the quality DataFrames for all channels in the _corr_img_dict.
+        The per-channel medians come from one selection pass over the
+        contiguous image stack rather than a separate call per channel
+        view.
 
         Returns:
             pd.DataFrame: Concatenated DataFrame containing quality control metrics for all channels.
         """
+        medians = np.median(self._image.img_stack, axis=(0, 2, 3))
         df_list = [
-            self._set_quality_df(channel, image)
-            for channel, image in self._image.img_dict.items()
+            self._set_quality_df(
+                channel, float(medians[self._image.channel_index[channel]])
+            )
+            for channel in self._image.img_dict
         ]
         return pd.concat(df_list)
@@ -15,6 +15,7 @@ from collections import Counter
 from typing import Any
 
 from omero.gateway import BlitzGateway, FileAnnotationWrapper, PlateWrapper
+from omero.sys import ParametersI
 from omero_utils.attachments import (
     delete_excel_attachment,
     get_file_attachments,
@@ -23,7 +24,6 @@ from omero_utils.attachments import (
 from omero_utils.map_anns import (
     add_map_annotations,
     delete_map_annotations,
-    parse_annotations,
 )
 from omero_utils.message import (
     ChannelAnnotationError,
@@ -44,6 +44,18 @@ console = Console()
 
 SUCCESS_STYLE = "bold cyan"
 
+# Channel names (lowercased) accepted as the nuclei channel and
+# normalized to "DAPI" during validation.
+_NUCLEI_ALIASES = frozenset({"dapi", "hoechst", "dna", "rfp"})
+
+# Keys every well metadata table must provide.
+_REQUIRED_WELL_KEYS = frozenset({"Well", "cell_line"})
+
+# Parsed Excel workbooks keyed by (OriginalFile id, sha1). Instantiating
+# several parsers against the same attachment then skips the repeated
+# download and parse; a re-uploaded file gets a new id/hash and misses.
+_excel_cache: dict[tuple[int, str], dict[str, Any]] = {}
+
 
 # --------------------Metadata Parser--------------------
 class MetadataParser:
@@ -60,6 +72,11 @@ class MetadataParser:
         pixel_size (float): Pixel size in micrometers, determined from the first image.
     """
 
+    # Lazily built index of well position -> row in the well_data lists;
+    # gives per-well lookups an O(1) hash access instead of a linear scan.
+    # Class-level default so subclasses that bypass __init__ resolve it.
+    _well_index: dict[str, int] | None = None
+
     def __init__(self, conn: BlitzGateway, plate_id: int):
         """Initializes the MetadataParser with an OMERO connection and plate ID.
 
@@ -69,6 +86,7 @@ class MetadataParser:
         """
         self.conn: BlitzGateway = conn
         self.plate_id: int = plate_id
+        self._plate: PlateWrapper | None = None
         self._check_plate()
         self.excel_file: bool = False
         self.channel_data: dict[str, str] = {}
@@ -107,7 +125,7 @@ class MetadataParser:
         if self.excel_file:  # if excel file is found, add channel and well annotations to plate and delete excel file
             self._add_channel_annotations(self.channel_data)
             self._add_well_annotations(self.well_data)
-            delete_excel_attachment(self.conn, self._get_plate())
+            delete_excel_attachment(self.conn, self._refresh_plate())
             log_success(
                 SUCCESS_STYLE,
                 f"Metadata parsed from Excel file and transferred to plate {self.plate_id}",
@@ -201,12 +219,28 @@ class MetadataParser:
         Raises:
             ExcelParsingError: If the Excel file format is invalid or missing required sheets.
         """
-        meta_data = parse_excel_data(file_annotations)
-        if not meta_data or list(meta_data.keys()) != ["Sheet1", "Sheet2"]:
-            raise ExcelParsingError(
-                "Invalid excel file format - expected Sheet1 and Sheet2",
-                logger,
-            )
+        original_file = file_annotations.getFile()
+        cache_key = (original_file.getId(), original_file.getHash())
+        meta_data = _excel_cache.get(cache_key)
+        if meta_data is None:
+            try:
+                # Only read the two sheets we need instead of the whole
+                # workbook; pandas raises ValueError when a requested sheet
+                # is missing.
+                meta_data = parse_excel_data(
+                    file_annotations, sheet_names=["Sheet1", "Sheet2"]
+                )
+            except ValueError as e:
+                raise ExcelParsingError(
+                    "Invalid excel file format - expected Sheet1 and Sheet2",
+                    logger,
+                ) from e
+            if not meta_data or set(meta_data.keys()) != {"Sheet1", "Sheet2"}:
+                raise ExcelParsingError(
+                    "Invalid excel file format - expected Sheet1 and Sheet2",
+                    logger,
+                )
+            _excel_cache[cache_key] = meta_data
 
         channel_data = {
             meta_data["Sheet1"]["Channels"][i]: str(
@@ -231,8 +265,9 @@ class MetadataParser:
         Args:
             channel_data (dict[str, str]): Dictionary mapping channel names to indices to be added as annotations.
         """
-        delete_map_annotations(self.conn, self._get_plate())
-        add_map_annotations(self.conn, self._get_plate(), channel_data)
+        plate = self._refresh_plate()
+        delete_map_annotations(self.conn, plate)
+        add_map_annotations(self.conn, plate, channel_data)
 
     def _add_well_annotations(self, well_data: dict[str, Any]) -> None:
         """Replace existing well annotations with new metadata for each well in the plate.
@@ -243,10 +278,10 @@ class MetadataParser:
         Args:
             well_data (dict[str, Any]): Dictionary mapping annotation keys to lists of values for each well.
         """
-        for well in self._get_plate().listChildren():
+        for well in self._refresh_plate().listChildren():
             delete_map_annotations(self.conn, well)
             well_name = well.getWellPos()
-            well_index = well_data["Well"].index(well_name)
+            well_index = self._well_row(well_name)
             well_meta_data = {
                 key: values[well_index]
                 for key, values in well_data.items()
@@ -267,7 +302,25 @@ class MetadataParser:
         Raises:
             ChannelAnnotationError: If no channel annotations are found on the plate.
         """
-        annotations: dict[str, str] = parse_annotations(self._get_plate())
+        # One fetch-joined query returns the map annotations with their
+        # key-value pairs already initialized, instead of listing every
+        # annotation on the plate and filtering client-side.
+        query = (
+            "select a from PlateAnnotationLink l "
+            "join l.child as a "
+            "left outer join fetch a.mapValue "
+            "where l.parent.id = :pid and a.class = MapAnnotation"
+        )
+        params = ParametersI()
+        params.addLong("pid", self.plate_id)
+        map_annotations = self.conn.getQueryService().findAllByQuery(
+            query, params, self.conn.SERVICE_OPTS
+        )
+        annotations: dict[str, str] = {
+            named_value.name: named_value.value
+            for ann in map_annotations
+            for named_value in ann.getMapValue() or []
+        }
         if len(annotations):
             return annotations
         else:
@@ -289,25 +342,54 @@ class MetadataParser:
             WellAnnotationError: If any well is missing annotations.
         """
         well_data: dict[str, list[Any]] = {"Well": []}
+        ann_by_well = self._well_annotation_index()
 
         for well in self._get_plate().listChildren():
             well_pos = well.getWellPos()
             well_data["Well"].append(well_pos)
 
-            well_annotation = parse_annotations(well)
+            well_annotation = ann_by_well.get(well.getId(), {})
             if not well_annotation:
                 raise WellAnnotationError(
                     f"No well annotations found for well {well_pos}", logger
                 )
 
-            # For each key in the well's annotations, ensure it exists in well_data
-            # and append the value to its list
+            # For each key in the well's annotations, create its list on
+            # first sight and append the value to it
             for key, value in well_annotation.items():
-                if key not in well_data:
-                    well_data[key] = []
-                well_data[key].append(value)
+                well_data.setdefault(key, []).append(value)
         return well_data
 
+    def _well_annotation_index(self) -> dict[int, dict[str, Any]]:
+        """Fetch the map annotations of all wells in the plate in one query.
+
+        A single HQL query loads every well annotation link together with
+        its key-value pairs, replacing the per-well annotation fetch that
+        issued one server round-trip per well.
+
+        Returns:
+            dict[int, dict[str, Any]]: Mapping of well id to that well's key-value annotations.
+        """
+        query = (
+            "select l from WellAnnotationLink l "
+            "join fetch l.parent as w "
+            "join fetch l.child as a "
+            "left outer join fetch a.mapValue "
+            "where w.plate.id = :pid and a.class = MapAnnotation"
+        )
+        params = ParametersI()
+        params.addLong("pid", self.plate_id)
+        links = self.conn.getQueryService().findAllByQuery(
+            query, params, self.conn.SERVICE_OPTS
+        )
+
+        ann_by_well: dict[int, dict[str, Any]] = {}
+        for link in links:
+            annotations = ann_by_well.setdefault(link.parent.id.val, {})
+            for named_value in link.child.getMapValue() or []:
+                annotations[named_value.name] = named_value.value
+        return ann_by_well
+
     def _create_two_column_table(
         self, title: str, col1_name: str, col2_name: str
     ) -> Table:
@@ -416,11 +498,16 @@ class MetadataParser:
         if not self.well_data:
             errors.append("No well data found")
 
-        if not isinstance(self.channel_data, dict) or not all(
-            isinstance(k, str) for k in self.channel_data
-        ):
+        # Single pass over the channel items instead of one scan per check
+        bad_keys = not isinstance(self.channel_data, dict)
+        bad_values = False
+        if not bad_keys:
+            for key, value in self.channel_data.items():
+                bad_keys = bad_keys or not isinstance(key, str)
+                bad_values = bad_values or not isinstance(value, str)
+        if bad_keys:
             errors.append("Channel data must be a dictionary with string keys")
-        if not all(isinstance(v, str) for v in self.channel_data.values()):
+        if bad_values:
             errors.append(
                 "Channel data must be a dictionary with string values"
             )
@@ -437,14 +524,13 @@ class MetadataParser:
             list[str]: A list of error messages. The list is empty if no errors are found.
         """
         errors = []
-        nuclei_channels = {"dapi", "hoechst", "dna", "rfp"}
         found_nuclei = False
         channel_data_normalized = {}
 
-        # First pass: normalize keys and check for nuclei channels
+        # First pass: normalize keys and check for nuclei channels; each
+        # key is case-folded exactly once for the alias lookup
         for key, value in self.channel_data.items():
-            normalized_key = key.lower()
-            if normalized_key in nuclei_channels:
+            if key.casefold() in _NUCLEI_ALIASES:
                 found_nuclei = True
                 channel_data_normalized["DAPI"] = value
             else:
@@ -467,25 +553,26 @@ class MetadataParser:
         """
         errors = []
         # Check required keys exist
-        required_keys = {"Well", "cell_line"}
-        if missing_keys := required_keys - self.well_data.keys():
+        if missing_keys := _REQUIRED_WELL_KEYS - self.well_data.keys():
             errors.append(
                 f"Missing required keys in well data: {', '.join(missing_keys)}"
             )
 
-        if non_list_keys := [
-            key
-            for key, value in self.well_data.items()
-            if not isinstance(value, list)
-        ]:
+        # One pass over the columns collects the non-list keys and the
+        # per-key lengths used by the checks below
+        non_list_keys = []
+        list_lengths = {}
+        for key, value in self.well_data.items():
+            if not isinstance(value, list):
+                non_list_keys.append(key)
+            list_lengths[key] = len(value)
+
+        if non_list_keys:
             errors.append(
                 f"Values must be lists for all keys. Non-list values found for: {', '.join(non_list_keys)}"
             )
 
         # Check all lists have the same length
-        list_lengths = {
-            key: len(value) for key, value in self.well_data.items()
-        }
         if len(set(list_lengths.values())) > 1:
             # Create a message showing the different lengths
             length_info = [
@@ -511,16 +598,12 @@ class MetadataParser:
         """
         errors = []
         # Get actual well positions from the plate
-        actual_wells = [
-            well.getWellPos() for well in self._get_plate().listChildren()
-        ]
+        s1 = {well.getWellPos() for well in self._get_plate().listChildren()}
 
         # Get well positions from metadata
-        metadata_wells = self.well_data["Well"]
+        s2 = set(self.well_data["Well"])
 
         # Check for missing and extra wells
-        s1 = set(actual_wells)
-        s2 = set(metadata_wells)
         if s1 != s2:
             missing_wells = s1 - s2
             extra_wells = s2 - s1
@@ -621,15 +704,47 @@ class MetadataParser:
         Returns:
             dict[str, Any]: Dictionary with annotations
         """
-        idx = self.well_data["Well"].index(well_id)
+        idx = self._well_row(well_id)
         return {k: v[idx] for k, v in self.well_data.items() if k != "Well"}
 
+    def _well_row(self, well_id: str) -> int:
+        """Get the row of the given well position in the well_data lists.
+
+        Builds the position index on first use; subsequent lookups are a
+        single dict access. Matches list.index's first-occurrence
+        semantics for duplicate positions.
+
+        Returns:
+            int: Index into the well_data value lists.
+        """
+        if self._well_index is None:
+            index: dict[str, int] = {}
+            for i, well in enumerate(self.well_data["Well"]):
+                index.setdefault(well, i)
+            self._well_index = index
+        return self._well_index[well_id]
+
     def _get_plate(self) -> PlateWrapper:
-        """Get a refreshed plate object from OMERO.
+        """Get the plate object from OMERO, cached on the parser.
+
+        The wrapper is fetched once and reused across the read-only parsing
+        and validation steps, avoiding a server round-trip per access.
+        Methods that modify the plate call _refresh_plate instead.
+
+        Returns:
+            The OMERO plate object
+        """
+        if self._plate is None:
+            self._plate = self.conn.getObject("Plate", self.plate_id)
+        return self._plate
+
+    def _refresh_plate(self) -> PlateWrapper:
+        """Fetch a fresh plate object from OMERO and update the cache.
 
-        This method is used to obtain an updated plate after all modifications to the object.
+        This method is used to obtain an updated plate after modifications to the object.
 
         Returns:
             The OMERO plate object
         """
-        return self.conn.getObject("Plate", self.plate_id)
+        self._plate = self.conn.getObject("Plate", self.plate_id)
+        return self._plate
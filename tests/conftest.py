@@ -315,7 +315,7 @@ def standard_excel_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def base_plate_with_annotations(
     omero_conn, base_plate, request: pytest.FixtureRequest
 ):
@@ -323,6 +323,12 @@ def base_plate_with_annotations(
     First cleans up any existing annotations, then adds:
     1. Channel annotations to the plate (DAPI:0, Tub:1, EdU:2)
     2. Well annotations to each well (cell_line and condition)
+
+    Module-scoped so the annotation setup runs once per test module
+    instead of once per test. Tests that delete annotations from the
+    underlying base_plate must run after the consumers of this fixture
+    (or recreate the annotations themselves); session scope would leak
+    such deletions across modules.
     """
     from omero.constants.metadata import NSCLIENTMAPANNOTATION
     from omero.gateway import MapAnnotationWrapper
@@ -119,11 +119,22 @@ def test_parse_channel_annotations_no_annotations(base_plate):
     assert str(exc_info.value) == "No channel annotations found on plate"
 
 
-def test_parse_channel_annotations_success(base_plate_with_annotations):
-    """Test that channel annotations are correctly parsed."""
+@pytest.fixture(scope="module")
+def parser_with_annotations(base_plate_with_annotations):
+    """Provide a MetadataParser built against the annotated base plate.
+
+    Centralizes the parser construction (and its plate validation
+    round-trip) for the tests that only read the parsed annotations;
+    module scope matches base_plate_with_annotations so the parser is
+    built once per module.
+    """
     plate = base_plate_with_annotations
-    parser = MetadataParser(plate._conn, plate.getId())
-    channel_data = parser._parse_channel_annotations()
+    return MetadataParser(plate._conn, plate.getId())
+
+
+def test_parse_channel_annotations_success(parser_with_annotations):
+    """Test that channel annotations are correctly parsed."""
+    channel_data = parser_with_annotations._parse_channel_annotations()
 
     # Check that we got all expected channels with correct indices
     expected_channels = {"DAPI": "0", "Tub": "1", "EdU": "2"}
@@ -133,11 +144,9 @@ def test_parse_channel_annotations_success(base_plate_with_annotations):
     )
 
 
-def test_parse_well_annotations_success(base_plate_with_annotations):
+def test_parse_well_annotations_success(parser_with_annotations):
     """Test that well annotations are correctly parsed."""
-    plate = base_plate_with_annotations
-    parser = MetadataParser(plate._conn, plate.getId())
-    well_data = parser._parse_well_annotations()
+    well_data = parser_with_annotations._parse_well_annotations()
 
     # Get indices that would sort the wells alphabetically
     sort_indices = sorted(
@@ -157,12 +166,16 @@ def test_parse_well_annotations_success(base_plate_with_annotations):
 
 def test_parse_well_annotations_failure(base_plate):
     """Test that appropriate error is raised when no well annotations exist."""
-    for well in base_plate.listChildren():
-        for ann in well.listAnnotations():
-            base_plate._conn.deleteObject(ann._obj)
-
-    for ann in base_plate.listAnnotations():
-        base_plate._conn.deleteObject(ann._obj)
+    # Collect all annotation ids and delete them in one batched call
+    # instead of a server round-trip per annotation
+    ann_ids = [
+        ann.getId()
+        for well in base_plate.listChildren()
+        for ann in well.listAnnotations()
+    ]
+    ann_ids += [ann.getId() for ann in base_plate.listAnnotations()]
+    if ann_ids:
+        base_plate._conn.deleteObjects("Annotation", ann_ids, wait=True)
     plate_id = base_plate.getId()
     conn = base_plate._conn
     parser = MetadataParser(conn, plate_id)
@@ -178,6 +191,31 @@ def test_parse_well_annotations_failure(base_plate):
 # Im mocking the parser class here to test the validation methods
 
 
+class MockWell:
+    """Mock well exposing only the position accessor the parser uses."""
+
+    __slots__ = ("pos",)
+
+    def __init__(self, pos):
+        self.pos = pos
+
+    def getWellPos(self):
+        return self.pos
+
+
+class MockPlate:
+    """Mock plate exposing only the child listing the parser uses."""
+
+    __slots__ = ("wells", "_children")
+
+    def __init__(self, wells):
+        self.wells = wells
+        self._children = tuple(MockWell(pos) for pos in wells)
+
+    def listChildren(self):
+        return self._children
+
+
 class MockParser(MetadataParser):
     """Mock parser class for testing channel data validation."""
 
@@ -186,26 +224,7 @@ class MockParser(MetadataParser):
         # This avoids the need for OMERO connection objects
         self.channel_data = channel_data if channel_data is not None else {}
         self.well_data = well_data if well_data is not None else {}
-
-        # Create mock well class
-        class MockWell:
-            def __init__(self, pos):
-                self.pos = pos
-
-            def getWellPos(self):
-                return self.pos
-
-        # Create mock plate class
-        class MockPlate:
-            def __init__(self, wells):
-                self.wells = wells
-
-            def listChildren(self):
-                return [MockWell(pos) for pos in wells]
-
-        # Initialize mock plate
-        wells = plate_wells or []
-        self.plate = MockPlate(wells)
+        self.plate = MockPlate(plate_wells or [])
 
     # Override the method to refresh the plate from OMERO
     def _get_plate(self) -> PlateWrapper:
@@ -215,63 +234,55 @@ class MockParser(MetadataParser):
 # --------------------TEST Validate Metadata Structure--------------------
 
 
-def test_validate_metadata_structure_success():
-    """Test that valid metadata structure passes validation."""
-    parser = MockParser(
-        channel_data={"DAPI": "0", "GFP": "1"},
-        well_data={"Well": ["A1", "A2"], "condition": ["ctrl", "treat"]},
-    )
-    errors = parser._validate_metadata_structure()
-    assert not errors, "No errors should be found for valid metadata"
-
-
-def test_validate_metadata_structure_missing_channel_data():
-    """Test that missing channel data raises an error."""
-    parser = MockParser(well_data={"Well": ["A1", "A2"]})
-    errors = parser._validate_metadata_structure()
-    assert len(errors) == 1
-    assert errors[0] == "No channel data found"
-
-
-def test_validate_metadata_structure_missing_well_data():
-    """Test that missing well data raises an error."""
-    parser = MockParser(channel_data={"DAPI": "0", "GFP": "1"})
-    errors = parser._validate_metadata_structure()
-    assert len(errors) == 1
-    assert errors[0] == "No well data found"
-
-
-def test_validate_metadata_structure_invalid_channel_keys():
-    """Test that non-string channel keys raise an error."""
-    parser = MockParser(
-        channel_data={1: "0", "GFP": "1"}, well_data={"Well": ["A1"]}
-    )
-    errors = parser._validate_metadata_structure()
-    assert len(errors) == 1
-    assert errors[0] == "Channel data must be a dictionary with string keys"
-
-
-def test_validate_metadata_structure_invalid_channel_values():
-    """Test that non-string channel values raise an error."""
-    parser = MockParser(
-        channel_data={"DAPI": 0, "GFP": "1"},  # 0 is an int, not a string
-        well_data={"Well": ["A1"]},
-    )
-    errors = parser._validate_metadata_structure()
-    assert len(errors) == 1
-    assert errors[0] == "Channel data must be a dictionary with string values"
-
-
-def test_validate_metadata_structure_multiple_errors():
-    """Test that multiple validation errors are collected."""
-    parser = MockParser(
-        channel_data={1: 0},  # Invalid key and value
-        well_data={"Well": "A1"},  # Not a list
-    )
+@pytest.mark.parametrize(
+    ("channel_data", "well_data", "expected_errors"),
+    [
+        pytest.param(
+            {"DAPI": "0", "GFP": "1"},
+            {"Well": ["A1", "A2"], "condition": ["ctrl", "treat"]},
+            [],
+            id="success",
+        ),
+        pytest.param(
+            None,
+            {"Well": ["A1", "A2"]},
+            ["No channel data found"],
+            id="missing_channel_data",
+        ),
+        pytest.param(
+            {"DAPI": "0", "GFP": "1"},
+            None,
+            ["No well data found"],
+            id="missing_well_data",
+        ),
+        pytest.param(
+            {1: "0", "GFP": "1"},
+            {"Well": ["A1"]},
+            ["Channel data must be a dictionary with string keys"],
+            id="invalid_channel_keys",
+        ),
+        pytest.param(
+            {"DAPI": 0, "GFP": "1"},  # 0 is an int, not a string
+            {"Well": ["A1"]},
+            ["Channel data must be a dictionary with string values"],
+            id="invalid_channel_values",
+        ),
+        pytest.param(
+            {1: 0},  # Invalid key and value
+            {"Well": "A1"},  # Not a list
+            [
+                "Channel data must be a dictionary with string keys",
+                "Channel data must be a dictionary with string values",
+            ],
+            id="multiple_errors",
+        ),
+    ],
+)
+def test_validate_metadata_structure(channel_data, well_data, expected_errors):
+    """Test that structural metadata errors are collected as expected."""
+    parser = MockParser(channel_data=channel_data, well_data=well_data)
     errors = parser._validate_metadata_structure()
-    assert len(errors) == 2  # Invalid key and invalid value
-    assert "Channel data must be a dictionary with string keys" in errors
-    assert "Channel data must be a dictionary with string values" in errors
+    assert errors == expected_errors
 
 
 # --------------------TEST Validate Channel Data--------------------
@@ -285,42 +296,22 @@ def test_validate_channel_data_with_dapi():
     assert parser.channel_data == {"DAPI": "0", "GFP": "1"}
 
 
-def test_validate_channel_data_normalize_hoechst():
-    """Test that Hoechst is normalized to DAPI."""
-    parser = MockParser({"Hoechst": 0, "GFP": 1})
-    parser._validate_channel_data()
-    assert "DAPI" in parser.channel_data
-    assert parser.channel_data["DAPI"] == 0
-    assert "Hoechst" not in parser.channel_data
-    assert parser.channel_data["GFP"] == 1
-
-
-def test_validate_channel_data_normalize_dna():
-    """Test that DNA is normalized to DAPI."""
-    parser = MockParser({"DNA": 0, "GFP": 1})
-    parser._validate_channel_data()
-    assert "DAPI" in parser.channel_data
-    assert parser.channel_data["DAPI"] == 0
-    assert "DNA" not in parser.channel_data
-    assert parser.channel_data["GFP"] == 1
-
-
-def test_validate_channel_data_normalize_rfp():
-    """Test that RFP is normalized to DAPI."""
-    parser = MockParser({"RFP": 0, "GFP": 1})
-    parser._validate_channel_data()
-    assert "DAPI" in parser.channel_data
-    assert parser.channel_data["DAPI"] == 0
-    assert "RFP" not in parser.channel_data
-    assert parser.channel_data["GFP"] == 1
-
-
-def test_validate_channel_data_case_insensitive():
-    """Test that nuclei channel detection is case insensitive."""
-    parser = MockParser({"dapi": 0, "GFP": 1})
+@pytest.mark.parametrize(
+    "alias",
+    [
+        pytest.param("Hoechst", id="hoechst"),
+        pytest.param("DNA", id="dna"),
+        pytest.param("RFP", id="rfp"),
+        pytest.param("dapi", id="case_insensitive"),
+    ],
+)
+def test_validate_channel_data_normalize(alias):
+    """Test that nuclei channel aliases are normalized to DAPI."""
+    parser = MockParser({alias: 0, "GFP": 1})
     parser._validate_channel_data()
     assert "DAPI" in parser.channel_data
     assert parser.channel_data["DAPI"] == 0
+    assert alias not in parser.channel_data
     assert parser.channel_data["GFP"] == 1
 
 
@@ -338,69 +329,98 @@ def test_validate_channel_data_no_nuclei_channel():
 # --------------------TEST Validate Well Data--------------------
 
 
-def test_validate_well_data_success():
-    """Test that valid well data passes validation."""
-    parser = MockParser(
-        well_data={
-            "Well": ["A1", "A2"],
-            "cell_line": ["RPE1", "RPE1"],
-            "condition": ["ctrl", "treat"],
-        },
-        plate_wells=["A1", "A2"],
-    )
-    errors = parser._validate_well_data()
-    assert not errors
-
-
-def test_validate_well_data_missing_required_key():
-    """Test that missing required key raises an error."""
-    parser = MockParser(
-        well_data={
-            "Well": ["A1", "A2"],
-            "condition": ["ctrl", "treat"],  # Missing cell_line
-        },
-        plate_wells=["A1", "A2"],
-    )
-    errors = parser._validate_well_data()
-    assert len(errors) == 1
-    assert "Missing required keys in well data: cell_line" in errors[0]
-
-
-def test_validate_well_data_non_list_values():
-    """Test that non-list values raise an error."""
-    parser = MockParser(
-        well_data={
-            "Well": ["A1", "A2"],
-            "cell_line": "RPE1",  # Should be a list
-            "condition": ["ctrl", "treat"],
-        },
-        plate_wells=["A1", "A2"],
-    )
-    errors = parser._validate_well_data()
-    assert (
-        len(errors) == 2
-    )  # Non-list value error and well position validation error
-    assert any(
-        "Values must be lists for all keys" in error for error in errors
-    )
-    assert any("cell_line" in error for error in errors)
-
-
-def test_validate_well_data_inconsistent_lengths():
-    """Test that lists of different lengths raise an error."""
-    parser = MockParser(
-        well_data={
-            "Well": ["A1", "A2"],
-            "cell_line": ["RPE1", "RPE1", "RPE1"],  # One extra value
-            "condition": ["ctrl", "treat"],
-        },
-        plate_wells=["A1", "A2"],
-    )
+@pytest.mark.parametrize(
+    ("well_data", "expected_error_count", "expected_substrings"),
+    [
+        pytest.param(
+            {
+                "Well": ["A1", "A2"],
+                "cell_line": ["RPE1", "RPE1"],
+                "condition": ["ctrl", "treat"],
+            },
+            0,
+            [],
+            id="success",
+        ),
+        pytest.param(
+            {
+                "Well": ["A1", "A2"],
+                "condition": ["ctrl", "treat"],  # Missing cell_line
+            },
+            1,
+            ["Missing required keys in well data: cell_line"],
+            id="missing_required_key",
+        ),
+        pytest.param(
+            {
+                "Well": ["A1", "A2"],
+                "cell_line": "RPE1",  # Should be a list
+                "condition": ["ctrl", "treat"],
+            },
+            2,  # Non-list value error and length mismatch error
+            ["Values must be lists for all keys", "cell_line"],
+            id="non_list_values",
+        ),
+        pytest.param(
+            {
+                "Well": ["A1", "A2"],
+                "cell_line": ["RPE1", "RPE1", "RPE1"],  # One extra value
+                "condition": ["ctrl", "treat"],
+            },
+            1,
+            [
+                "All well data lists must have the same length",
+                "Well: 2",
+                "cell_line: 3",
+            ],
+            id="inconsistent_lengths",
+        ),
+        pytest.param(
+            {
+                "Well": ["A1", "A1"],  # Duplicate well
+                "cell_line": ["RPE1", "RPE1"],
+                "condition": ["ctrl", "treat"],
+            },
+            1,
+            ["Missing wells in metadata"],
+            id="missing_well",
+        ),
+        pytest.param(
+            {
+                "Well": ["A1", "A2", "A3"],  # Extra well
+                "cell_line": ["RPE1", "RPE1", "TS2"],
+                "condition": ["ctrl", "treat", "other"],
+            },
+            1,
+            ["Extra wells in metadata"],
+            id="extra_well",
+        ),
+        pytest.param(
+            {
+                "Well": ["A2", "A3"],  # Wrong wells
+                "cell_line": "RPE1",  # Not a list
+                "condition": ["ctrl", "treat"],
+            },
+            4,  # Non-list, length mismatch, missing and extra well errors
+            [
+                "Values must be lists for all keys",
+                "Missing wells in metadata",
+                "Extra wells in metadata",
+                "cell_line",
+            ],
+            id="multiple_errors",
+        ),
+    ],
+)
+def test_validate_well_data(
+    well_data, expected_error_count, expected_substrings
+):
+    """Test that well data errors are collected as expected."""
+    parser = MockParser(well_data=well_data, plate_wells=["A1", "A2"])
     errors = parser._validate_well_data()
-    assert len(errors) == 1
-    assert "All well data lists must have the same length" in errors[0]
-    assert "Well: 2" in errors[0]
-    assert "cell_line: 3" in errors[0]
+    assert len(errors) == expected_error_count
+    for substring in expected_substrings:
+        assert any(substring in error for error in errors)
 
 
 def test_validate_well_data_wrong_well_order():
@@ -416,55 +436,3 @@ def test_validate_well_data_wrong_well_order():
     parser._validate_well_data()
     assert parser.well_conditions("A1")["condition"] == "treat"
     assert parser.well_conditions("A2")["condition"] == "ctrl"
-
-
-def test_validate_well_data_missing_well():
-    """Test that a missing well raises an error."""
-    parser = MockParser(
-        well_data={
-            "Well": ["A1", "A1"],  # Duplicate well
-            "cell_line": ["RPE1", "RPE1"],
-            "condition": ["ctrl", "treat"],
-        },
-        plate_wells=["A1", "A2"],
-    )
-    errors = parser._validate_well_data()
-    assert len(errors) == 1
-    assert any("Missing wells in metadata" in error for error in errors)
-
-
-def test_validate_well_data_extra_well():
-    """Test that an extra well raises an error."""
-    parser = MockParser(
-        well_data={
-            "Well": ["A1", "A2", "A3"],  # Extra well
-            "cell_line": ["RPE1", "RPE1", "TS2"],
-            "condition": ["ctrl", "treat", "other"],
-        },
-        plate_wells=["A1", "A2"],
-    )
-    errors = parser._validate_well_data()
-    assert len(errors) == 1
-    assert any("Extra wells in metadata" in error for error in errors)
-
-
-def test_validate_well_data_multiple_errors():
-    """Test that multiple well data errors are collected."""
-    parser = MockParser(
-        well_data={
-            "Well": ["A2", "A3"],  # Wrong wells
-            "cell_line": "RPE1",  # Not a list
-            "condition": ["ctrl", "treat"],
-        },
-        plate_wells=["A1", "A2"],
-    )
-    errors = parser._validate_well_data()
-    assert (
-        len(errors) == 4
-    )  # Non-list value error, well order error, and well position validation error
-    assert any(
-        "Values must be lists for all keys" in error for error in errors
-    )
-    assert any("Missing wells in metadata" in error for error in errors)
-    assert any("Extra wells in metadata" in error for error in errors)
-    assert any("cell_line" in error for error in errors)